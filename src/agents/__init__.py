@@ -1,10 +1,11 @@
-from src.agents.voice_agent import VoiceAgent, AgentState
+from src.agents.voice_agent import VoiceAgent, AgentState, get_voice_agent
 from src.agents.tools import property_search, transfer_call, end_call
 from src.agents.prompts import SYSTEM_PROMPT, GREETING_PROMPT
 
 __all__ = [
     "VoiceAgent",
     "AgentState",
+    "get_voice_agent",
     "property_search",
     "transfer_call",
     "end_call",
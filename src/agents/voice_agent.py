@@ -1,4 +1,5 @@
 from typing import TypedDict, Annotated, Sequence, Literal
+from functools import lru_cache
 import operator
 
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
@@ -157,3 +158,8 @@ class VoiceAgent:
         """Reset the agent state."""
         self._graph = None
 
+
+@lru_cache
+def get_voice_agent() -> VoiceAgent:
+    """Get singleton voice agent instance."""
+    return VoiceAgent()
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -23,6 +24,11 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    # Load speech models in the background so startup isn't blocked
+    warmup_task = None
+    if settings.preload_models:
+        warmup_task = asyncio.create_task(voice.call_service.warmup())
+
     if settings.wandb_enabled:
         monitor.init(
             run_name=f"{settings.app_name}-server",
@@ -31,8 +37,11 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    if warmup_task:
+        warmup_task.cancel()
     monitor.finish()
     logger.info(f"Shutting down {settings.app_name}")
+    await logger.complete()
 
 
 app = FastAPI(
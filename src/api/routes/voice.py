@@ -1,6 +1,7 @@
 import json
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Request
 
 from src.api.schemas import CallRequest, CallResponse, PropertySearchRequest, PropertySearchResponse
@@ -75,7 +76,6 @@ async def websocket_stream(websocket: WebSocket, call_sid: str):
                     logger.info(f"🎙️ Generating greeting audio...")
                     greeting_audio = await call_service.get_greeting_audio(call_sid)
                     if greeting_audio:
-                        import base64
                         from datetime import datetime, timedelta
                         
                         # Set speaking time to ignore echo during greeting
@@ -84,11 +84,9 @@ async def websocket_stream(websocket: WebSocket, call_sid: str):
                             session.speaking_until = datetime.utcnow() + timedelta(seconds=speaking_duration)
                         
                         logger.info(f"📤 Sending greeting: {len(greeting_audio)} bytes ({speaking_duration:.1f}s)")
-                        await websocket.send_json({
-                            "event": "media",
-                            "streamSid": stream_sid,
-                            "media": {"payload": base64.b64encode(greeting_audio).decode()},
-                        })
+                        session.stream_sid = stream_sid
+                        frame = session.media_frame(greeting_audio)
+                        await websocket.send_text(orjson.dumps(frame).decode())
                         logger.info("✅ Greeting sent successfully")
                         greeting_sent = True
 
@@ -98,7 +96,7 @@ async def websocket_stream(websocket: WebSocket, call_sid: str):
                 # Make sure response uses correct streamSid
                 if stream_sid and response.get("streamSid") != stream_sid:
                     response["streamSid"] = stream_sid
-                await websocket.send_json(response)
+                await websocket.send_text(orjson.dumps(response).decode())
 
             if event == "stop":
                 break
@@ -1,6 +1,12 @@
-from src.audio.processor import AudioProcessor
-from src.audio.stt import WhisperSTT
-from src.audio.tts import KokoroTTS
-
-__all__ = ["AudioProcessor", "WhisperSTT", "KokoroTTS"]
+from src.audio.processor import AudioProcessor, get_audio_processor
+from src.audio.stt import WhisperSTT, get_stt
+from src.audio.tts import KokoroTTS, get_tts
 
+__all__ = [
+    "AudioProcessor",
+    "WhisperSTT",
+    "KokoroTTS",
+    "get_audio_processor",
+    "get_stt",
+    "get_tts",
+]
@@ -1,6 +1,7 @@
 import io
 import struct
 from typing import Optional
+from functools import lru_cache
 
 import numpy as np
 import soundfile as sf
@@ -16,6 +17,20 @@ MULAW_BIAS = 0x84
 MULAW_CLIP = 32635
 
 
+def _build_mulaw_decode_table() -> np.ndarray:
+    """Decode all 256 mu-law byte values to PCM16 at once."""
+    byte = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (byte & 0x70) >> 4
+    mantissa = byte & 0x0F
+    sample = (((mantissa << 3) + MULAW_BIAS) << exponent) - MULAW_BIAS
+    return np.where(byte & 0x80, -sample, sample).astype(np.int16)
+
+
+# Indexed by mu-law byte value; decoding is a single table lookup
+MULAW_DECODE_TABLE = _build_mulaw_decode_table()
+MULAW_DECODE_TABLE.flags.writeable = False
+
+
 class AudioProcessor:
     """Audio format conversion for telephony (mu-law, PCM16)."""
 
@@ -30,23 +45,7 @@ class AudioProcessor:
     def mulaw_to_pcm16(self, mulaw_data: bytes) -> np.ndarray:
         """Convert mu-law encoded audio to PCM16 numpy array."""
         try:
-            pcm_samples = []
-            for byte in mulaw_data:
-                byte = ~byte
-                sign = (byte & 0x80) >> 7
-                exponent = (byte & 0x70) >> 4
-                mantissa = byte & 0x0F
-
-                sample = (mantissa << 3) + MULAW_BIAS
-                sample <<= exponent
-                sample -= MULAW_BIAS
-
-                if sign:
-                    sample = -sample
-
-                pcm_samples.append(sample)
-
-            return np.array(pcm_samples, dtype=np.int16)
+            return MULAW_DECODE_TABLE[np.frombuffer(mulaw_data, dtype=np.uint8)]
         except Exception as e:
             raise AudioError(f"Failed to convert mu-law to PCM16: {e}")
 
@@ -145,3 +144,8 @@ class AudioProcessor:
         chunk_size = int(self.sample_rate * chunk_duration_ms / 1000)
         return [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
 
+
+@lru_cache
+def get_audio_processor() -> AudioProcessor:
+    """Get singleton audio processor instance."""
+    return AudioProcessor()
@@ -1,5 +1,11 @@
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from math import gcd
+import asyncio
 import io
+import os
+import threading
 
 import numpy as np
 import httpx
@@ -10,34 +16,137 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Whisper models expect 16kHz input
+WHISPER_SAMPLE_RATE = 16000
+
+# mlx_whisper's ModelHolder caches one process-wide model keyed by repo only,
+# ignoring dtype. Models are cached here per (repo, compute type) instead and
+# installed into ModelHolder for the duration of each transcribe, under the lock
+_MLX_MODELS: dict[tuple[str, str], object] = {}
+_MLX_LOCK = threading.Lock()
+
+# Local models are loaded and run only on this one thread (MLX streams are per
+# thread). It is shared by every WhisperSTT, so instances never leak workers
+_worker = threading.local()
+
+
+def _mark_worker() -> None:
+    _worker.active = True
+
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="whisper", initializer=_mark_worker
+)
+
+
+def _on_worker(fn, *args):
+    """Run fn on the inference thread and wait for it (inline if already there)."""
+    if getattr(_worker, "active", False):
+        return fn(*args)
+    return _EXECUTOR.submit(fn, *args).result()
+
 
 class WhisperSTT:
-    """Speech-to-text using MLX Whisper (local) or Groq Whisper API (cloud)."""
+    """Speech-to-text using MLX Whisper or faster-whisper (local) or Groq Whisper API (cloud)."""
 
     def __init__(
         self,
         model_size: Optional[str] = None,
         provider: Optional[str] = None,
+        compute_type: Optional[str] = None,
     ):
         self.model_size = model_size or settings.whisper_model_size
         self.provider = provider or settings.stt_provider
+        self.compute_type = compute_type or settings.whisper_compute_type
         self._model = None
+        self._mlx_model = None
         self._processor = None
 
+    @property
+    def _mlx_repo(self) -> str:
+        return f"mlx-community/whisper-{self.model_size}-mlx"
+
+    @property
+    def _fp16(self) -> bool:
+        return self.compute_type == "float16"
+
     def _load_model(self) -> None:
-        """Lazy load the Whisper model (local only)."""
-        if self._model is not None or self.provider != "local":
+        """Lazy load the Whisper model (local providers only)."""
+        if self._model is not None or self.provider == "groq":
             return
 
         try:
-            import mlx_whisper
-
-            logger.info(f"Loading Whisper model: {self.model_size}")
-            self._model = mlx_whisper
+            logger.info(f"Loading Whisper model: {self.model_size} ({self.provider})")
+            if self.provider == "faster_whisper":
+                from faster_whisper import WhisperModel
+
+                # CTranslate2 defaults to 4 CPU threads; use every core
+                self._model = WhisperModel(
+                    self.model_size,
+                    device="auto",
+                    # CTranslate2 falls back on its own when the device lacks
+                    # the type (e.g. float16 runs as float32 on most CPUs)
+                    compute_type=self.compute_type,
+                    cpu_threads=os.cpu_count() or 0,
+                )
+            else:
+                import mlx.core as mx
+                import mlx.nn as nn
+                import mlx_whisper
+                from mlx_whisper.audio import mel_filters
+                from mlx_whisper.load_models import load_model
+
+                key = (self._mlx_repo, self.compute_type)
+                with _MLX_LOCK:
+                    model = _MLX_MODELS.get(key)
+                    if model is None:
+                        # Load the weights now rather than on the first transcribe.
+                        # They come from memory-mapped safetensors straight into
+                        # the decode dtype, with no float32 copy when running fp16
+                        dtype = mx.float16 if self._fp16 else mx.float32
+                        model = load_model(self._mlx_repo, dtype=dtype)
+                        if self.compute_type == "int8":
+                            # Our own copy, so quantizing never affects other instances
+                            nn.quantize(
+                                model, bits=8, class_predicate=lambda _, m: isinstance(m, nn.Linear)
+                            )
+                        _MLX_MODELS[key] = model
+                self._mlx_model = model
+                # mel_filters is lru_cached; fill it now instead of reading the
+                # filterbank .npz on the first transcription
+                mel_filters(model.dims.n_mels)
+                self._model = mlx_whisper
             logger.info("Whisper model loaded successfully")
         except Exception as e:
             raise TranscriptionError(f"Failed to load Whisper model: {e}")
 
+    @staticmethod
+    def _preprocess(audio: np.ndarray, sample_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+        """Convert audio to 16kHz mono float32, scaling int16 PCM to [-1, 1].
+
+        Channels are averaged with a float32 accumulator so float64 or int16
+        input never produces a float64 intermediate. Other sample rates are
+        converted with a polyphase FIR filter (resample_poly).
+        """
+        is_pcm16 = audio.dtype == np.int16
+
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        else:
+            audio = audio.astype(np.float32, copy=False)
+
+        if is_pcm16:
+            # Always a fresh array here, so scaling in place is safe
+            audio *= 1.0 / 32768.0
+
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            from scipy.signal import resample_poly
+
+            g = gcd(WHISPER_SAMPLE_RATE, sample_rate)
+            audio = resample_poly(audio, WHISPER_SAMPLE_RATE // g, sample_rate // g)
+            audio = audio.astype(np.float32, copy=False)
+        return audio
+
     def transcribe(
         self,
         audio: np.ndarray,
@@ -55,12 +164,11 @@ class WhisperSTT:
             Transcribed text
         """
         if self.provider == "groq":
-            import asyncio
             return asyncio.get_event_loop().run_until_complete(
                 self._transcribe_groq(audio, language, sample_rate)
             )
 
-        return self._transcribe_local(audio, language, sample_rate)
+        return _on_worker(self._transcribe_local, audio, language, sample_rate)
 
     def _transcribe_local(
         self,
@@ -68,25 +176,30 @@ class WhisperSTT:
         language: str = "en",
         sample_rate: int = 16000,
     ) -> str:
-        """Transcribe using local MLX Whisper."""
+        """Transcribe using local MLX Whisper or faster-whisper."""
         self._load_model()
 
         try:
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-
-            if len(audio.shape) > 1:
-                audio = audio.mean(axis=1)
-
-            model_name = f"mlx-community/whisper-{self.model_size}-mlx"
-
-            result = self._model.transcribe(
-                audio,
-                path_or_hf_repo=model_name,
-                language=language,
-            )
+            audio = self._preprocess(audio, sample_rate)
+
+            if self.provider == "faster_whisper":
+                segments, _ = self._model.transcribe(audio, language=language)
+                text = "".join(segment.text for segment in segments).strip()
+            else:
+                from mlx_whisper.transcribe import ModelHolder
+
+                with _MLX_LOCK:
+                    # ModelHolder returns the installed model for a matching repo
+                    ModelHolder.model = self._mlx_model
+                    ModelHolder.model_path = self._mlx_repo
+                    result = self._model.transcribe(
+                        audio,
+                        path_or_hf_repo=self._mlx_repo,
+                        language=language,
+                        fp16=self._fp16,
+                    )
+                text = result.get("text", "").strip()
 
-            text = result.get("text", "").strip()
             logger.debug(f"Transcription (local): {text[:100]}...")
             return text
 
@@ -106,14 +219,10 @@ class WhisperSTT:
         try:
             import soundfile as sf
 
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-
-            if len(audio.shape) > 1:
-                audio = audio.mean(axis=1)
+            audio = self._preprocess(audio, sample_rate)
 
             buffer = io.BytesIO()
-            sf.write(buffer, audio, sample_rate, format="WAV")
+            sf.write(buffer, audio, WHISPER_SAMPLE_RATE, format="WAV")
             buffer.seek(0)
             audio_bytes = buffer.read()
 
@@ -141,24 +250,63 @@ class WhisperSTT:
         except Exception as e:
             raise TranscriptionError(f"Groq transcription failed: {e}")
 
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        language: str = "en",
+        sample_rate: int = 16000,
+    ) -> list[str]:
+        """Transcribe several clips, returning texts in input order.
+
+        Groq requests are sent concurrently. The local backends have no
+        multi-clip forward pass, so clips run back to back on the loaded model.
+        """
+        if self.provider == "groq":
+            return asyncio.get_event_loop().run_until_complete(
+                self._transcribe_groq_batch(audios, language, sample_rate)
+            )
+
+        return _on_worker(
+            lambda: [self._transcribe_local(audio, language, sample_rate) for audio in audios]
+        )
+
+    async def _transcribe_groq_batch(
+        self,
+        audios: list[np.ndarray],
+        language: str = "en",
+        sample_rate: int = 16000,
+    ) -> list[str]:
+        """Send one Groq request per clip, all in flight at once."""
+        return list(
+            await asyncio.gather(
+                *(self._transcribe_groq(audio, language, sample_rate) for audio in audios)
+            )
+        )
+
+    def load_model(self) -> None:
+        """Load the model on the inference thread, blocking until it's ready."""
+        _on_worker(self._load_model)
+
+    async def load_model_async(self) -> None:
+        """Load the model on the inference thread without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(_EXECUTOR, self._load_model)
+
     async def transcribe_async(
         self,
         audio: np.ndarray,
         language: str = "en",
         sample_rate: int = 16000,
     ) -> str:
-        """Async wrapper for transcription."""
+        """Async wrapper for transcription (local providers run on the inference thread)."""
         if self.provider == "groq":
             return await self._transcribe_groq(audio, language, sample_rate)
 
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, lambda: self._transcribe_local(audio, language, sample_rate)
+        return await asyncio.get_running_loop().run_in_executor(
+            _EXECUTOR, partial(self._transcribe_local, audio, language, sample_rate)
         )
 
     def clear_cache(self) -> None:
-        """Clear MLX cache to free memory."""
+        """Clear MLX cache to free memory (MLX provider only)."""
         if self.provider != "local":
             return
 
@@ -169,3 +317,8 @@ class WhisperSTT:
         except Exception as e:
             logger.warning(f"Failed to clear MLX cache: {e}")
 
+
+@lru_cache
+def get_stt() -> WhisperSTT:
+    """Get singleton Whisper STT instance."""
+    return WhisperSTT()
@@ -1,13 +1,54 @@
 from typing import Optional, Generator
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
+import os
+import struct
+import threading
 
 import numpy as np
 
 from src.config import settings
 from src.utils.errors import TTSError
-from src.utils.logging import get_logger
+from src.utils.logging import get_hot_logger, get_logger
 
 logger = get_logger(__name__)
+hot_logger = get_hot_logger(__name__)
+
+def _as_float32(audio) -> np.ndarray:
+    """View a pipeline output (torch tensor, mlx or numpy array) as float32 numpy."""
+    if hasattr(audio, "detach"):  # torch tensor; .numpy() shares CPU memory
+        audio = audio.detach().cpu().numpy()
+    return np.asarray(audio, dtype=np.float32)
+
+
+def resolve_device(device: str = "auto") -> str:
+    """Resolve "auto" to the fastest available torch device (cuda, mps, cpu)."""
+    if device != "auto":
+        return device
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _wav_header(num_samples: int, sample_rate: int) -> bytes:
+    """Build the 44-byte header of a mono 16-bit PCM WAV file."""
+    data_size = num_samples * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size,
+    )
 
 
 class KokoroTTS:
@@ -20,59 +61,158 @@ class KokoroTTS:
     ):
         self.model_name = model or settings.tts_model
         self.voice = voice or settings.tts_voice
+        self.dtype = settings.kokoro_dtype
+        self.compile = settings.use_torch_compile
+        self.device = settings.tts_device
         self._pipeline = None
         self._sample_rate = 24000
 
+        # LRU of synthesized audio; entries are read-only and shared with callers
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_size = settings.tts_cache_size
+        self._cache_dir = Path(settings.tts_cache_dir).expanduser() if settings.tts_cache_dir else None
+        self._cache_lock = threading.Lock()
+
     def _load_model(self) -> None:
         """Lazy load the Kokoro TTS pipeline."""
         if self._pipeline is not None:
             return
 
         try:
+            self.device = resolve_device(self.device)
+            if self.dtype == "int8" and self.device != "cpu":
+                # Dynamically quantized kernels only exist for the CPU
+                logger.info(f"Kokoro int8 runs on cpu; ignoring device {self.device}")
+                self.device = "cpu"
+            if self.device == "mps":
+                # Let ops without an MPS kernel fall back to the CPU
+                os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
+
             from kokoro import KPipeline
 
-            logger.info(f"Loading Kokoro TTS model: {self.model_name}")
-            self._pipeline = KPipeline(lang_code="a")
+            logger.info(f"Loading Kokoro TTS model: {self.model_name} on {self.device}")
+            self._pipeline = KPipeline(lang_code="a", device=self.device)
+            model = getattr(self._pipeline, "model", None)
+            if self.dtype == "int8" and model is not None:
+                import torch
+
+                self._pipeline.model = model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+                )
+            if self.compile and model is not None:
+                import torch
+
+                # Input length varies per sentence, so compile for dynamic shapes
+                self._pipeline.model = torch.compile(model, dynamic=True)
             logger.info("Kokoro TTS model loaded successfully")
         except Exception as e:
             raise TTSError(f"Failed to load Kokoro TTS model: {e}")
 
+    def _precision(self):
+        """Autocast context for reduced-precision inference (no-op for float32/int8)."""
+        model = getattr(self._pipeline, "model", None)
+        if self.dtype in ("float32", "int8") or model is None:
+            return nullcontext()
+
+        import torch
+
+        device_type = next(model.parameters()).device.type
+        return torch.autocast(device_type=device_type, dtype=getattr(torch, self.dtype))
+
+    def _generate(self, text: str, speed: float) -> Generator:
+        """Run the pipeline, applying the configured precision to each step only."""
+        generator = self._pipeline(text, voice=self.voice, speed=speed)
+
+        while True:
+            with self._precision():
+                result = next(generator, None)
+            if result is None:
+                return
+            _, _, audio = result
+            yield audio
+
+    def _cache_key(self, text: str, speed: float) -> str:
+        key = f"{self.model_name}|{self.voice}|{self.dtype}|{speed}|{text}"
+        return blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[np.ndarray]:
+        """Look up cached audio in memory, then on disk (memory-mapped)."""
+        with self._cache_lock:
+            audio = self._cache.get(key)
+            if audio is not None:
+                self._cache.move_to_end(key)
+                return audio
+
+        if self._cache_dir is None:
+            return None
+        path = self._cache_dir / f"{key}.f32"
+        if not path.exists():
+            return None
+
+        audio = np.memmap(path, dtype=np.float32, mode="r")
+        self._cache_put(key, audio, persist=False)
+        return audio
+
+    def _cache_put(self, key: str, audio: np.ndarray, persist: bool = True) -> None:
+        if self._cache_size > 0:
+            audio.flags.writeable = False
+            with self._cache_lock:
+                self._cache[key] = audio
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        if persist and self._cache_dir is not None:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                audio.tofile(self._cache_dir / f"{key}.f32")
+            except OSError as e:
+                logger.warning(f"Failed to write TTS cache entry: {e}")
+
     def synthesize(self, text: str, speed: float = 1.0) -> np.ndarray:
         """Synthesize speech from text.
 
+        Repeated (text, voice, speed) requests are served from the cache.
+
         Args:
             text: Text to synthesize
             speed: Speech speed multiplier
 
         Returns:
-            Audio as float32 numpy array at 24kHz
+            Audio as float32 numpy array at 24kHz (read-only when cached)
         """
+        if not text.strip():
+            return np.array([], dtype=np.float32)
+
+        use_cache = self._cache_size > 0 or self._cache_dir is not None
+        if use_cache:
+            key = self._cache_key(text, speed)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
         self._load_model()
 
         try:
-            if not text.strip():
-                return np.array([], dtype=np.float32)
-
-            logger.info(f"🔊 TTS synthesizing: '{text[:50]}...'")
+            hot_logger.info("🔊 TTS synthesizing: '{}...'", lambda: text[:50])
             audio_segments = []
-            generator = self._pipeline(text, voice=self.voice, speed=speed)
 
-            for _, _, audio in generator:
+            for audio in self._generate(text, speed):
                 if audio is not None:
-                    # Convert mlx array to numpy if needed
-                    if hasattr(audio, 'tolist'):  # mlx array
-                        audio = np.array(audio.tolist(), dtype=np.float32)
-                    elif not isinstance(audio, np.ndarray):
-                        audio = np.array(audio, dtype=np.float32)
-                    audio_segments.append(audio)
+                    audio_segments.append(_as_float32(audio))
 
             if not audio_segments:
                 raise TTSError("No audio generated")
 
             combined = np.concatenate(audio_segments)
             duration = len(combined) / self._sample_rate
-            logger.info(f"🔊 TTS generated {duration:.2f}s of audio ({len(combined)} samples)")
-            return combined.astype(np.float32)
+            hot_logger.info(
+                "🔊 TTS generated {:.2f}s of audio ({} samples)", lambda: duration, lambda: len(combined)
+            )
+            combined = combined.astype(np.float32, copy=False)
+            if use_cache:
+                self._cache_put(key, combined)
+            return combined
 
         except TTSError:
             raise
@@ -84,6 +224,8 @@ class KokoroTTS:
     ) -> Generator[np.ndarray, None, None]:
         """Stream synthesized audio chunks.
 
+        Chunks are float32 views of the pipeline's output (no per-chunk copy).
+
         Args:
             text: Text to synthesize
             speed: Speech speed multiplier
@@ -94,11 +236,9 @@ class KokoroTTS:
         self._load_model()
 
         try:
-            generator = self._pipeline(text, voice=self.voice, speed=speed)
-
-            for _, _, audio in generator:
+            for audio in self._generate(text, speed):
                 if audio is not None:
-                    yield audio
+                    yield _as_float32(audio)
 
         except Exception as e:
             raise TTSError(f"TTS streaming failed: {e}")
@@ -116,11 +256,10 @@ class KokoroTTS:
         return self._sample_rate
 
     def save_audio(self, audio: np.ndarray, filepath: str | Path) -> None:
-        """Save audio to file."""
+        """Save audio to a mono 16-bit PCM WAV file."""
         try:
-            import soundfile as sf
-
-            sf.write(str(filepath), audio, self._sample_rate)
+            pcm = np.clip(np.asarray(audio) * 32767.0, -32768, 32767).astype("<i2")
+            Path(filepath).write_bytes(_wav_header(len(pcm), self._sample_rate) + pcm.tobytes())
             logger.debug(f"Saved audio to {filepath}")
         except Exception as e:
             raise TTSError(f"Failed to save audio: {e}")
@@ -135,3 +274,8 @@ class KokoroTTS:
         except Exception as e:
             logger.warning(f"Failed to clear cache: {e}")
 
+
+@lru_cache
+def get_tts() -> KokoroTTS:
+    """Get singleton Kokoro TTS instance."""
+    return KokoroTTS()
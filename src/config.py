@@ -31,13 +31,27 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
 
-    # STT Provider: "local" (MLX Whisper) or "groq" (Groq Whisper API)
-    stt_provider: Literal["local", "groq"] = "local"
+    # STT Provider: "local" (MLX Whisper), "faster_whisper" (CTranslate2, CPU/CUDA)
+    # or "groq" (Groq Whisper API)
+    stt_provider: Literal["local", "faster_whisper", "groq"] = "local"
 
     # MLX Models
     whisper_model_size: Literal["tiny", "base", "small","medium", "large-v3"] = "base"
     tts_model: str = "kokoro-v0_19"
     tts_voice: str = "af_sarah"
+    # Synthesized audio cache for repeated phrases (greetings, prompts)
+    tts_cache_size: int = 128  # in-memory entries; 0 disables
+    tts_cache_dir: str = ""  # optional on-disk cache, e.g. ~/.cache/kokoro-tts
+    # Torch device for Kokoro; "auto" picks cuda, then mps, then cpu
+    tts_device: Literal["auto", "cuda", "mps", "cpu"] = "auto"
+
+    # Inference precision (lower precision is faster but less exact).
+    # "int8" quantizes Linear weights at load; Kokoro int8 runs on the CPU
+    whisper_compute_type: Literal["int8", "float16", "float32"] = "float16"
+    kokoro_dtype: Literal["int8", "float32", "bfloat16", "float16"] = "float32"
+    preload_models: bool = True  # Load STT/TTS in the background at startup
+    # Compile the Kokoro model with torch.compile (slow first call, faster after)
+    use_torch_compile: bool = False
 
     # Pinecone
     pinecone_api_key: str = ""
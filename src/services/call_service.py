@@ -1,21 +1,31 @@
 import asyncio
 import base64
+import binascii
 import json
 from typing import Optional
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import select, update
 from langchain_core.messages import BaseMessage
 
-from src.agents.voice_agent import VoiceAgent
-from src.audio import AudioProcessor, WhisperSTT, KokoroTTS
+from src.agents.voice_agent import get_voice_agent
+from src.audio import get_audio_processor, get_stt, get_tts
+from src.audio.processor import MULAW_DECODE_TABLE
 from src.database import async_session_maker
 from src.database.models import CallLog, CallDirection, CallStatus
 from src.services.twilio_service import TwilioService
-from src.utils.logging import get_logger
+from src.utils.logging import get_hot_logger, get_logger
 from src.utils.monitoring import monitor
 
 logger = get_logger(__name__)
+hot_logger = get_hot_logger(__name__)
+
+# Twilio media streams are 8kHz mu-law: one byte per sample
+TWILIO_SAMPLE_RATE = 8000
+
+# Energy VAD floor so line noise isn't mistaken for speech before a peak is seen
+VAD_NOISE_FLOOR_DB = -50.0
 
 
 class CallSession:
@@ -23,6 +33,7 @@ class CallSession:
 
     def __init__(self, call_sid: str, caller_number: str, direction: CallDirection):
         self.call_sid = call_sid
+        self.call_log_id: Optional[int] = None  # CallLog primary key, set by start_call
         self.caller_number = caller_number
         self.direction = direction
         self.messages: list[BaseMessage] = []
@@ -31,24 +42,57 @@ class CallSession:
         self.start_time = datetime.utcnow()
         self.is_active = True
         self.last_audio_time = datetime.utcnow()
-        self.silence_threshold = 1.5  # seconds of silence to trigger processing
+        self.silence_threshold = 0.5  # seconds of silence that ends an utterance
+        self.energy_threshold_db = -35.0  # speech if within this many dB of the peak
+        self.min_segment = 1.5  # seconds of buffered audio before endpointing
+        self.max_segment = 10.0  # force processing once this much audio is buffered
         self.min_audio_length = 1600  # minimum bytes (~0.1s at 8kHz mu-law)
+        self.peak_db = VAD_NOISE_FLOOR_DB  # loudest chunk in the current utterance
+        self.speech_detected = False  # True once the caller starts talking
+        self.silence_duration = 0.0  # seconds of continuous silence after speech
         self.is_processing = False
         self.is_speaking = False  # True when TTS audio is being sent
         self.speaking_until: datetime | None = None  # When to stop ignoring input
+        self.stream_sid: Optional[str] = None  # Twilio media stream, set on "start"
+        self._media_frame = {"event": "media", "streamSid": None, "media": {"payload": ""}}
+
+    def media_frame(self, audio: bytes) -> dict:
+        """Build an outbound Twilio media message for mu-law audio.
+
+        The same dict is reused for every frame, so serialize it before
+        building the next one.
+        """
+        self._media_frame["streamSid"] = self.stream_sid
+        self._media_frame["media"]["payload"] = binascii.b2a_base64(
+            audio, newline=False
+        ).decode("ascii")
+        return self._media_frame
 
 
 class CallService:
     """Manages phone call lifecycle and audio processing."""
 
     def __init__(self):
-        self.agent = VoiceAgent()
-        self.stt = WhisperSTT()
-        self.tts = KokoroTTS()
-        self.audio_processor = AudioProcessor()
+        # Models are shared process-wide so multiple services don't load them twice
+        self.agent = get_voice_agent()
+        self.stt = get_stt()
+        self.tts = get_tts()
+        self.audio_processor = get_audio_processor()
         self.twilio = TwilioService()
         self._sessions: dict[str, CallSession] = {}
 
+    async def warmup(self) -> None:
+        """Preload STT/TTS models off the event loop so the first caller isn't delayed."""
+        loaders = (
+            ("STT", self.stt.load_model_async),
+            ("TTS", lambda: asyncio.to_thread(self.tts._load_model)),
+        )
+        for name, load_model in loaders:
+            try:
+                await load_model()
+            except Exception as e:
+                logger.warning(f"{name} warmup failed: {e}")
+
     async def start_call(
         self,
         call_sid: str,
@@ -92,8 +136,10 @@ class CallService:
                 )
                 db.add(call_log)
                 await db.commit()
+                session.call_log_id = call_log.id
                 logger.info(f"Started call session: {call_sid}")
             else:
+                session.call_log_id = existing.id
                 logger.debug(f"Call log already exists for {call_sid}")
 
         return session
@@ -102,21 +148,49 @@ class CallService:
         """Get an active call session."""
         return self._sessions.get(call_sid)
 
-    def _detect_silence(self, audio_data: bytes, threshold: int = 10) -> bool:
-        """Detect if audio chunk is silence (mu-law).
-        
+    @staticmethod
+    def _call_log_filter(call_sid: str, session: Optional[CallSession] = None):
+        """Build the WHERE clause for a call's log row.
+
+        Uses the cached primary key when the session knows it, so the update
+        goes straight to the rowid instead of through the call_sid index.
+        """
+        if session is not None and session.call_log_id is not None:
+            return CallLog.id == session.call_log_id
+        return CallLog.call_sid == call_sid
+
+    def _is_speech(self, session: CallSession, audio_data: bytes) -> bool:
+        """Classify a mu-law chunk as speech using RMS energy.
+
+        A chunk counts as speech when its level is within
+        ``session.energy_threshold_db`` of the loudest chunk heard so far
+        and above the absolute noise floor. The peak is reset per utterance
+        so one loud transient doesn't mute later, quieter speech.
+
         Args:
-            audio_data: Mu-law encoded audio bytes
-            threshold: Amplitude threshold for silence detection
-            
+            session: Call session holding the running peak level
+            audio_data: Mu-law encoded audio bytes (one 20ms Twilio frame)
+
         Returns:
-            True if audio is mostly silence
+            True if the chunk contains speech
         """
-        if len(audio_data) < 100:
+        if not audio_data:
             return False
-        # Mu-law silence is around 127-128
-        silence_count = sum(1 for b in audio_data if 120 <= b <= 136)
-        return silence_count > len(audio_data) * 0.8
+
+        pcm16 = MULAW_DECODE_TABLE[np.frombuffer(audio_data, dtype=np.uint8)].astype(np.float32)
+        rms = float(np.sqrt(np.mean(pcm16**2)))
+        level_db = 20 * np.log10(max(rms, 1.0) / 32768.0)
+
+        session.peak_db = max(session.peak_db, level_db)
+        threshold = max(session.peak_db + session.energy_threshold_db, VAD_NOISE_FLOOR_DB)
+        return level_db >= threshold
+
+    @staticmethod
+    def _reset_vad(session: CallSession) -> None:
+        """Clear per-utterance VAD state after a segment is consumed."""
+        session.speech_detected = False
+        session.silence_duration = 0.0
+        session.peak_db = VAD_NOISE_FLOOR_DB
 
     async def process_audio_chunk(
         self,
@@ -148,13 +222,19 @@ class CallService:
         session.is_processing = True
 
         try:
-            logger.info(f"🎤 Processing {len(session.audio_buffer)} bytes of audio...")
+            hot_logger.info("🎤 Processing {} bytes of audio...", lambda: len(session.audio_buffer))
             pcm_audio = self.audio_processor.mulaw_to_pcm16(session.audio_buffer)
             float_audio = pcm_audio.astype("float32") / 32768.0
             
             # CRITICAL: Resample from 8kHz (Twilio) to 16kHz (Whisper)
             float_audio_16k = self.audio_processor.resample(float_audio, orig_sr=8000, target_sr=16000)
-            logger.info(f"🎤 Converted to PCM: {len(pcm_audio)} samples @ 8kHz → {len(float_audio_16k)} samples @ 16kHz, range: [{float_audio_16k.min():.3f}, {float_audio_16k.max():.3f}]")
+            hot_logger.info(
+                "🎤 Converted to PCM: {} samples @ 8kHz → {} samples @ 16kHz, range: [{:.3f}, {:.3f}]",
+                lambda: len(pcm_audio),
+                lambda: len(float_audio_16k),
+                lambda: float_audio_16k.min(),
+                lambda: float_audio_16k.max(),
+            )
 
             with monitor.timer("latency/transcription"):
                 transcription = await self.stt.transcribe_async(float_audio_16k)
@@ -248,6 +328,9 @@ class CallService:
 
         if event == "start":
             stream_sid = message.get("start", {}).get("streamSid")
+            session = self.get_session(call_sid)
+            if session:
+                session.stream_sid = stream_sid
             logger.info(f"Stream started: {stream_sid}")
             return None
 
@@ -265,51 +348,60 @@ class CallService:
                         # Just finished speaking, clear buffer and reset
                         session.speaking_until = None
                         session.audio_buffer = b""
-                        session.silent_chunks = 0
-                        logger.debug("🔇 Finished speaking, now listening")
-                    
+                        self._reset_vad(session)
+                        hot_logger.debug("🔇 Finished speaking, now listening")
+
+                    chunk_duration = len(audio_data) / TWILIO_SAMPLE_RATE
+                    if self._is_speech(session, audio_data):
+                        session.speech_detected = True
+                        session.silence_duration = 0.0
+                    elif session.speech_detected:
+                        session.silence_duration += chunk_duration
+
                     session.audio_buffer += audio_data
-                    
-                    # Check if we have enough audio
-                    buffer_size = len(session.audio_buffer)
-                    is_silent = self._detect_silence(audio_data)
-                    
-                    # Track consecutive silence
-                    if is_silent:
-                        if not hasattr(session, 'silent_chunks'):
-                            session.silent_chunks = 0
-                        session.silent_chunks += 1
-                    else:
-                        session.silent_chunks = 0
-                    
-                    # Process when: enough audio AND (consecutive silence OR max buffer)
+
+                    if not session.speech_detected:
+                        # Nothing said yet: keep only a short pre-roll of silence
+                        preroll = int(session.silence_threshold * TWILIO_SAMPLE_RATE)
+                        session.audio_buffer = session.audio_buffer[-preroll:]
+                        return None
+
+                    # Endpoint on trailing silence once enough audio is buffered,
+                    # or force processing when the segment gets too long
+                    segment_duration = len(session.audio_buffer) / TWILIO_SAMPLE_RATE
                     should_process = (
-                        buffer_size >= 8000 and  # At least 0.5s of audio
-                        (getattr(session, 'silent_chunks', 0) >= 15 or buffer_size > 48000)  # ~15 silent chunks or ~3s max
-                    )
-                    
+                        segment_duration >= session.min_segment
+                        and session.silence_duration >= session.silence_threshold
+                    ) or segment_duration >= session.max_segment
+
                     if should_process:
-                        logger.info(f"Processing audio: {buffer_size} bytes, silent_chunks: {getattr(session, 'silent_chunks', 0)}")
+                        hot_logger.info(
+                            "Processing audio: {:.2f}s, trailing silence: {:.2f}s",
+                            lambda: segment_duration,
+                            lambda: session.silence_duration,
+                        )
                         response_audio = await self.process_audio_chunk(
                             call_sid, audio_data, is_final=True
                         )
-                        session.silent_chunks = 0  # Reset
+                        self._reset_vad(session)
                         if response_audio:
                             # Set speaking duration (audio length / 8000 samples per sec)
                             speaking_duration = len(response_audio) / 8000 + 0.5  # Add buffer
                             session.speaking_until = datetime.utcnow() + timedelta(seconds=speaking_duration)
-                            logger.info(f"📤 Sending {len(response_audio)} bytes ({speaking_duration:.1f}s) of response audio")
-                            return {
-                                "event": "media",
-                                "streamSid": message.get("streamSid"),
-                                "media": {"payload": base64.b64encode(response_audio).decode()},
-                            }
+                            hot_logger.info(
+                                "📤 Sending {} bytes ({:.1f}s) of response audio",
+                                lambda: len(response_audio),
+                                lambda: speaking_duration,
+                            )
+                            if session.stream_sid is None:
+                                session.stream_sid = message.get("streamSid")
+                            return session.media_frame(response_audio)
                         else:
                             logger.warning("⚠️ No response audio generated")
             return None
 
         elif event == "mark":
-            logger.debug(f"Mark received: {message.get('mark', {}).get('name')}")
+            hot_logger.debug("Mark received: {}", lambda: message.get("mark", {}).get("name"))
             return None
 
         elif event == "stop":
@@ -345,17 +437,17 @@ class CallService:
         duration = (datetime.utcnow() - session.start_time).seconds
 
         async with async_session_maker() as db:
-            result = await db.execute(
-                select(CallLog).where(CallLog.call_sid == call_sid)
+            await db.execute(
+                update(CallLog)
+                .where(self._call_log_filter(call_sid, session))
+                .values(
+                    status=CallStatus.COMPLETED,
+                    duration=duration,
+                    ended_at=datetime.utcnow(),
+                    transcription="\n".join(session.transcription_buffer),
+                )
             )
-            call_log = result.scalar_one_or_none()
-
-            if call_log:
-                call_log.status = CallStatus.COMPLETED
-                call_log.duration = duration
-                call_log.ended_at = datetime.utcnow()
-                call_log.transcription = "\n".join(session.transcription_buffer)
-                await db.commit()
+            await db.commit()
 
         monitor.log_call_metrics(
             call_sid=call_sid,
@@ -382,15 +474,15 @@ class CallService:
             call_sid: Call SID
             status: New status
         """
+        session = self.get_session(call_sid)
+
         async with async_session_maker() as db:
-            result = await db.execute(
-                select(CallLog).where(CallLog.call_sid == call_sid)
+            await db.execute(
+                update(CallLog)
+                .where(self._call_log_filter(call_sid, session))
+                .values(status=status)
             )
-            call_log = result.scalar_one_or_none()
-
-            if call_log:
-                call_log.status = status
-                await db.commit()
+            await db.commit()
 
         logger.debug(f"Updated call {call_sid} status to {status.value}")
 
@@ -11,6 +11,12 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Pre-bound templates for format_results_for_speech
+_OPTION_LINE = (
+    "Option {i}: A {beds} bedroom, {baths} bathroom home in {city} for ${price:,.0f}."
+).format
+_MORE_OPTIONS_LINE = "I have {extra} more options if you'd like to hear them.".format
+
 
 class SearchService:
     """Semantic search service for properties."""
@@ -127,36 +133,43 @@ class SearchService:
         Returns:
             Number of properties indexed
         """
+        indexed = 0
+
         async with async_session_maker() as session:
-            result = await session.execute(select(Property))
-            properties = result.scalars().all()
-
-            if not properties:
-                logger.warning("No properties found to index")
-                return 0
-
-            items = []
-            for prop in properties:
-                items.append(
-                    (
-                        str(prop.id),
-                        prop.to_search_text(),
-                        {
-                            "title": prop.title,
-                            "price": prop.price,
-                            "bedrooms": prop.bedrooms,
-                            "bathrooms": prop.bathrooms,
-                            "square_feet": prop.square_feet,
-                            "city": prop.city,
-                            "state": prop.state,
-                            "address": prop.address,
-                        },
+            result = await session.stream_scalars(
+                select(Property).execution_options(yield_per=batch_size)
+            )
+
+            # Upsert each partition as it arrives instead of loading every row first
+            async for properties in result.partitions(batch_size):
+                items = []
+                for prop in properties:
+                    items.append(
+                        (
+                            str(prop.id),
+                            prop.to_search_text(),
+                            {
+                                "title": prop.title,
+                                "price": prop.price,
+                                "bedrooms": prop.bedrooms,
+                                "bathrooms": prop.bathrooms,
+                                "square_feet": prop.square_feet,
+                                "city": prop.city,
+                                "state": prop.state,
+                                "address": prop.address,
+                            },
+                        )
                     )
-                )
 
-            await self.pinecone.upsert_batch(items, batch_size=batch_size)
-            logger.info(f"Indexed {len(properties)} properties")
-            return len(properties)
+                await self.pinecone.upsert_batch(items, batch_size=batch_size)
+                indexed += len(items)
+
+        if not indexed:
+            logger.warning("No properties found to index")
+            return 0
+
+        logger.info(f"Indexed {indexed} properties")
+        return indexed
 
     def format_results_for_speech(self, properties: list[dict]) -> str:
         """Format search results for text-to-speech.
@@ -174,20 +187,18 @@ class SearchService:
         result_word = "property" if count == 1 else "properties"
 
         lines = [f"I found {count} {result_word} that might interest you."]
-
-        for i, prop in enumerate(properties[:3], 1):
-            price = prop.get("price", 0)
-            beds = prop.get("bedrooms", 0)
-            baths = prop.get("bathrooms", 0)
-            city = prop.get("city", "")
-
-            lines.append(
-                f"Option {i}: A {beds} bedroom, {baths} bathroom home in {city} "
-                f"for ${price:,.0f}."
+        lines.extend(
+            _OPTION_LINE(
+                i=i,
+                beds=prop.get("bedrooms", 0),
+                baths=prop.get("bathrooms", 0),
+                city=prop.get("city", ""),
+                price=prop.get("price", 0),
             )
+            for i, prop in enumerate(properties[:3], 1)
+        )
 
         if count > 3:
-            lines.append(f"I have {count - 3} more options if you'd like to hear them.")
+            lines.append(_MORE_OPTIONS_LINE(extra=count - 3))
 
         return " ".join(lines)
-
@@ -1,3 +1,6 @@
+import base64
+import hmac
+from hashlib import sha1
 from typing import Optional
 
 from twilio.rest import Client
@@ -20,14 +23,21 @@ class TwilioService:
         auth_token: Optional[str] = None,
         phone_number: Optional[str] = None,
     ):
-        self.account_sid = account_sid or settings.twilio_account_sid
-        self.auth_token = auth_token or settings.twilio_auth_token
-        self.phone_number = phone_number or settings.twilio_phone_number
+        # None means "use settings"; an explicit empty string is kept as-is
+        self.account_sid = settings.twilio_account_sid if account_sid is None else account_sid
+        self.auth_token = settings.twilio_auth_token if auth_token is None else auth_token
+        self.phone_number = settings.twilio_phone_number if phone_number is None else phone_number
+
+        # Built up front since every webhook and outbound call needs them
         self._client: Optional[Client] = None
-        self._validator: Optional[RequestValidator] = None
+        if self.account_sid and self.auth_token:
+            self._client = Client(self.account_sid, self.auth_token)
+            logger.debug("Twilio client initialized")
+        self._validator = RequestValidator(self.auth_token)
+        self._signing_key = self.auth_token.encode("utf-8")
 
     def _get_client(self) -> Client:
-        """Get or create Twilio client."""
+        """Get the Twilio client."""
         if not self.account_sid or not self.auth_token:
             raise TwilioError("Twilio credentials not configured")
 
@@ -38,12 +48,15 @@ class TwilioService:
         return self._client
 
     def _get_validator(self) -> RequestValidator:
-        """Get or create request validator."""
-        if self._validator is None:
-            self._validator = RequestValidator(self.auth_token)
-
+        """Get the request validator."""
         return self._validator
 
+    def _compute_signature(self, url: str, params: dict) -> bytes:
+        """Compute the X-Twilio-Signature for a form-encoded webhook."""
+        payload = url + "".join(f"{key}{params[key]}" for key in sorted(params))
+        digest = hmac.new(self._signing_key, payload.encode("utf-8"), sha1).digest()
+        return base64.b64encode(digest)
+
     def validate_request(self, url: str, params: dict, signature: str) -> bool:
         """Validate incoming Twilio webhook request.
 
@@ -56,8 +69,14 @@ class TwilioService:
             True if request is valid
         """
         try:
-            validator = self._get_validator()
-            return validator.validate(url, params, signature)
+            # Fast path: the URL as received usually matches what Twilio signed
+            if isinstance(params, dict) and hmac.compare_digest(
+                self._compute_signature(url, params), signature.encode("ascii")
+            ):
+                return True
+
+            # Fall back to Twilio's validator for port variants and JSON bodies
+            return self._get_validator().validate(url, params, signature)
         except Exception as e:
             logger.error(f"Request validation failed: {e}")
             return False
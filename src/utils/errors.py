@@ -1,56 +1,117 @@
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+# Shared read-only default so raising without details doesn't allocate a dict
+_EMPTY_DETAILS: Mapping = MappingProxyType({})
 
 
 class AgentError(Exception):
     """Base exception for phone agent errors."""
 
-    def __init__(self, code: str, message: str, details: Optional[dict] = None):
+    # Slots keep raises from materializing an instance __dict__
+    __slots__ = ("code", "message", "_details")
+
+    CODE = "E000"
+    DEFAULT_MESSAGE = "Phone agent error"
+
+    def __init__(self, code: str, message: str, details: Optional[Mapping] = None):
         self.code = code
         self.message = message
-        self.details = details or {}
+        if details is not None:
+            self._details = details
         super().__init__(f"[{code}] {message}")
 
+    @property
+    def details(self) -> Mapping:
+        """Extra error context; a shared empty mapping when none was given."""
+        try:
+            return self._details
+        except AttributeError:
+            return _EMPTY_DETAILS
+
+    @details.setter
+    def details(self, value: Optional[Mapping]) -> None:
+        self._details = value if value is not None else _EMPTY_DETAILS
+
+    def __reduce__(self):
+        # BaseException pickles args and __dict__ only, which would drop the slots
+        return type(self), (self.code, self.message, dict(self.details))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Formatted once per class for raises that use the default message
+        cls._DEFAULT_STR = f"[{cls.CODE}] {cls.DEFAULT_MESSAGE}"
+
+
+class _CodedError(AgentError):
+    """Agent error whose code and default message are class attributes."""
+
+    __slots__ = ()
 
-class TranscriptionError(AgentError):
+    def __init__(self, message: Optional[str] = None, details: Optional[Mapping] = None):
+        if message is not None:
+            super().__init__(self.CODE, message, details)
+            return
+
+        self.code = self.CODE
+        self.message = self.DEFAULT_MESSAGE
+        if details is not None:
+            self._details = details
+        Exception.__init__(self, self._DEFAULT_STR)
+
+    def __reduce__(self):
+        return type(self), (self.message, dict(self.details))
+
+
+class TranscriptionError(_CodedError):
     """E001: Speech-to-text transcription failed."""
 
-    def __init__(self, message: str = "Transcription failed", details: Optional[dict] = None):
-        super().__init__("E001", message, details)
+    __slots__ = ()
+
+    CODE = "E001"
+    DEFAULT_MESSAGE = "Transcription failed"
 
 
-class TTSError(AgentError):
+class TTSError(_CodedError):
     """E002: Text-to-speech generation failed."""
 
-    def __init__(self, message: str = "TTS generation failed", details: Optional[dict] = None):
-        super().__init__("E002", message, details)
+    __slots__ = ()
 
+    CODE = "E002"
+    DEFAULT_MESSAGE = "TTS generation failed"
 
-class LLMError(AgentError):
+
+class LLMError(_CodedError):
     """E003: LLM request failed."""
 
-    def __init__(self, message: str = "LLM request failed", details: Optional[dict] = None):
-        super().__init__("E003", message, details)
+    __slots__ = ()
+
+    CODE = "E003"
+    DEFAULT_MESSAGE = "LLM request failed"
 
 
-class VectorSearchError(AgentError):
+class VectorSearchError(_CodedError):
     """E004: Vector search failed."""
 
-    def __init__(self, message: str = "Vector search failed", details: Optional[dict] = None):
-        super().__init__("E004", message, details)
+    __slots__ = ()
 
+    CODE = "E004"
+    DEFAULT_MESSAGE = "Vector search failed"
 
-class TwilioError(AgentError):
+
+class TwilioError(_CodedError):
     """E005: Twilio webhook validation failed."""
 
-    def __init__(
-        self, message: str = "Twilio webhook validation failed", details: Optional[dict] = None
-    ):
-        super().__init__("E005", message, details)
+    __slots__ = ()
+
+    CODE = "E005"
+    DEFAULT_MESSAGE = "Twilio webhook validation failed"
 
 
-class AudioError(AgentError):
-    """Audio processing error."""
+class AudioError(_CodedError):
+    """E006: Audio processing failed."""
 
-    def __init__(self, message: str = "Audio processing failed", details: Optional[dict] = None):
-        super().__init__("E006", message, details)
+    __slots__ = ()
 
+    CODE = "E006"
+    DEFAULT_MESSAGE = "Audio processing failed"
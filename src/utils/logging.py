@@ -1,10 +1,38 @@
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import zstandard
 from loguru import logger
 
 from src.config import settings
 
+# One worker shared by all sinks so rotations compress one at a time
+_compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+
+def _zstd_and_remove(path: str) -> None:
+    """Compress a rotated log file with zstd level 1 and delete the original."""
+    cctx = zstandard.ZstdCompressor(level=1, threads=-1)
+    with open(path, "rb") as src, open(f"{path}.zst", "wb") as dst:
+        cctx.copy_stream(src, dst)
+    os.remove(path)
+
+
+def _compress_in_background(path: str) -> None:
+    """Rotation hook that keeps compression off the logging worker."""
+    _compressor.submit(_zstd_and_remove, path)
+
+
+def _is_hot(record) -> bool:
+    """Records from high-frequency call-path sites (see get_hot_logger)."""
+    return record["extra"].get("hot") is True
+
+
+def _is_not_hot(record) -> bool:
+    return record["extra"].get("hot") is not True
+
 
 def setup_logging() -> None:
     """Configure loguru for the application."""
@@ -22,8 +50,10 @@ def setup_logging() -> None:
         format=log_format,
         level=settings.log_level,
         colorize=True,
+        filter=_is_not_hot,
     )
 
+    # File sinks write from loguru's queue worker so callers never block on disk I/O
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
@@ -33,7 +63,10 @@ def setup_logging() -> None:
         level=settings.log_level,
         rotation="10 MB",
         retention="7 days",
-        compression="zip",
+        compression=_compress_in_background,
+        enqueue=True,
+        catch=True,
+        filter=_is_not_hot,
     )
 
     logger.add(
@@ -42,7 +75,23 @@ def setup_logging() -> None:
         level="ERROR",
         rotation="10 MB",
         retention="30 days",
-        compression="zip",
+        compression=_compress_in_background,
+        enqueue=True,
+        catch=True,
+        filter=_is_not_hot,
+    )
+
+    # High-volume call telemetry: bare messages, no colour or timestamp formatting
+    logger.add(
+        log_dir / "telemetry.log",
+        format="{message}",
+        level="TRACE",
+        rotation="10 MB",
+        retention="3 days",
+        compression=_compress_in_background,
+        enqueue=True,
+        catch=True,
+        filter=_is_hot,
     )
 
 
@@ -50,3 +99,13 @@ def get_logger(name: str):
     """Get a logger instance with the given name."""
     return logger.bind(name=name)
 
+
+def get_hot_logger(name: str):
+    """Get a lazy logger for high-frequency sites.
+
+    Records go only to the plain telemetry sink, and callable arguments are
+    evaluated only if a sink accepts the record, e.g.
+    ``hot_logger.debug("range: {}", lambda: audio.max())``.
+    """
+    return logger.bind(name=name, hot=True).opt(lazy=True)
+
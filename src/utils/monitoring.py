@@ -1,5 +1,7 @@
 from typing import Any, Optional
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+import queue
+import threading
 import time
 
 from src.config import settings
@@ -7,6 +9,24 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Background W&B logging: metrics are merged and flushed off the caller's thread
+_QUEUE_SIZE = 1024
+_MAX_BATCH = 64
+_FLUSH_INTERVAL = 0.25  # seconds
+_STOP = object()
+
+# Metric keys for log_call_metrics, in argument order
+_CALL_METRIC_KEYS = (
+    "call/duration",
+    "latency/transcription",
+    "latency/llm",
+    "latency/tts",
+    "latency/total",
+)
+
+# Returned by timer() when monitoring is off, so hot paths skip the timing entirely
+_NOOP_TIMER = nullcontext()
+
 
 class WandbMonitor:
     """Weights & Biases monitoring integration."""
@@ -14,11 +34,12 @@ class WandbMonitor:
     def __init__(self):
         self._run = None
         self._enabled = settings.wandb_enabled and bool(settings.wandb_api_key)
+        self._queue: queue.Queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
 
     def init(self, run_name: Optional[str] = None, config: Optional[dict] = None) -> None:
         """Initialize a W&B run."""
         if not self._enabled:
-            logger.debug("W&B monitoring disabled")
             return
 
         try:
@@ -30,22 +51,68 @@ class WandbMonitor:
                 config=config or {},
                 reinit=True,
             )
-            logger.info(f"W&B run initialized: {self._run.name}")
+            self._worker = threading.Thread(target=self._drain, name="wandb-log", daemon=True)
+            self._worker.start()
+            logger.info("W&B run initialized: {name}", name=self._run.name)
         except Exception as e:
-            logger.warning(f"Failed to initialize W&B: {e}")
+            logger.warning("Failed to initialize W&B: {e}", e=e)
             self._enabled = False
 
     def log(self, metrics: dict[str, Any], step: Optional[int] = None) -> None:
-        """Log metrics to W&B."""
+        """Queue metrics for W&B without blocking the caller."""
         if not self._enabled or not self._run:
             return
 
+        item = (metrics, step)
         try:
-            import wandb
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Drop the oldest entry so the most recent metrics are kept
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                logger.debug("W&B metric queue full, dropping metrics")
+
+    def _drain(self) -> None:
+        """Worker loop: merge queued metrics and send them in one wandb.log call."""
+        import wandb
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            merged, step = dict(item[0]), item[1]
+            stop = False
+            deadline = time.monotonic() + _FLUSH_INTERVAL
+
+            for _ in range(_MAX_BATCH - 1):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+
+                merged.update(item[0])
+                if item[1] is not None:
+                    step = item[1] if step is None else max(step, item[1])
 
-            wandb.log(metrics, step=step)
-        except Exception as e:
-            logger.warning(f"Failed to log to W&B: {e}")
+            try:
+                wandb.log(merged, step=step)
+            except Exception as e:
+                logger.warning("Failed to log to W&B: {e}", e=e)
+
+            if stop:
+                return
 
     def log_call_metrics(
         self,
@@ -56,28 +123,44 @@ class WandbMonitor:
         tts_latency: float,
     ) -> None:
         """Log call-specific metrics."""
-        self.log(
-            {
-                "call/duration": duration,
-                "latency/transcription": transcription_latency,
-                "latency/llm": llm_latency,
-                "latency/tts": tts_latency,
-                "latency/total": transcription_latency + llm_latency + tts_latency,
-            }
+        if not self._enabled or not self._run:
+            return
+
+        # Plain floats so W&B doesn't treat numpy scalars as media to materialize
+        values = (
+            float(duration),
+            float(transcription_latency),
+            float(llm_latency),
+            float(tts_latency),
+            float(transcription_latency + llm_latency + tts_latency),
         )
+        self.log(dict(zip(_CALL_METRIC_KEYS, values)))
 
-    @contextmanager
     def timer(self, metric_name: str):
         """Context manager to time operations."""
-        start = time.perf_counter()
+        if not self._enabled or not self._run:
+            return _NOOP_TIMER
+        return self._timed(metric_name)
+
+    @contextmanager
+    def _timed(self, metric_name: str):
+        """Time the wrapped block and log the elapsed seconds."""
+        start = time.perf_counter_ns()
         try:
             yield
         finally:
-            elapsed = time.perf_counter() - start
-            self.log({metric_name: elapsed})
+            self.log({metric_name: (time.perf_counter_ns() - start) * 1e-9})
 
     def finish(self) -> None:
-        """Finish the current W&B run."""
+        """Flush queued metrics and finish the current W&B run."""
+        if self._worker:
+            try:
+                self._queue.put(_STOP, timeout=1.0)
+            except queue.Full:
+                logger.warning("W&B metric queue full at shutdown, some metrics dropped")
+            self._worker.join(timeout=5.0)
+            self._worker = None
+
         if self._run:
             try:
                 import wandb
@@ -85,10 +168,9 @@ class WandbMonitor:
                 wandb.finish()
                 logger.info("W&B run finished")
             except Exception as e:
-                logger.warning(f"Failed to finish W&B run: {e}")
+                logger.warning("Failed to finish W&B run: {e}", e=e)
             finally:
                 self._run = None
 
 
 monitor = WandbMonitor()
-
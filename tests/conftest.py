@@ -2,74 +2,265 @@
 Test configuration and fixtures.
 
 This file is loaded automatically by pytest.
-Fixtures are available to all test files.
+Fixtures are available to all test files; define shared ones here rather
+than per test file.
+
+Session-scoped:
+- aclient: in-process httpx client for the app
+- app_route_paths: route paths, collected once
+- settings_, twilio_service: shared read-only service objects
+- shared_stt, shared_tts: speech models loaded once (skip if not installed)
+- test_engine: in-memory database (test_db gives each test a rolled-back session)
+- sample_audio, sample_audio_bytes, sample_audio_float, silent_audio,
+  silent_audio_2s: read-only test audio
+
+Function-scoped:
+- test_db, fresh_settings, sample_property_data
+
+Under pytest-xdist (-n auto --dist=loadfile) session fixtures are built once
+per worker, and loadfile keeps a file's tests together so each model loads once.
 """
-import asyncio
+from __future__ import annotations
+
 import pytest
 import pytest_asyncio
-from typing import AsyncGenerator
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator
 import numpy as np
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
 
+# Run Kokoro at reduced precision in tests; set before src.config is imported
+os.environ.setdefault("KOKORO_DTYPE", "bfloat16")
+# Smoke-test Whisper with the tiny model (~39 MB); set TEST_WHISPER_SIZE for larger
+os.environ["WHISPER_MODEL_SIZE"] = os.environ.get("TEST_WHISPER_SIZE", "tiny")
+# The shared aclient runs the app lifespan; don't load speech models there
+os.environ.setdefault("PRELOAD_MODELS", "false")
 
 # Use in-memory SQLite for tests (avoids .env database URL issues)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# Point the app's own engine at the same kind of database, set before src.config
+# is imported. aiosqlite serves :memory: from a StaticPool, so the app and
+# services share one in-memory connection for the session instead of data/app.db
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Test audio is loaded once at import and shared read-only. The 2 second 440Hz
+# sine is precomputed (tests/fixtures/audio/gen_fixtures.py) and memory-mapped
+SAMPLE_RATE = 16000
+AUDIO_FIXTURES = Path(__file__).parent / "fixtures" / "audio"
+_SINE_2S_F32 = np.load(AUDIO_FIXTURES / "sine_440_2s.npy", mmap_mode="r")
+_SINE_F32 = _SINE_2S_F32[:SAMPLE_RATE]
+# Scale, round and saturate in a scratch buffer, then cast to int16 once
+_SCRATCH = np.multiply(_SINE_F32, 32767.0)
+np.rint(_SCRATCH, out=_SCRATCH)
+np.clip(_SCRATCH, -32768, 32767, out=_SCRATCH)
+_SINE_I16 = _SCRATCH.astype(np.int16)
+_SINE_BYTES = _SINE_I16.tobytes()
+del _SCRATCH
+# One zero buffer backs every silent-audio fixture; slice it, never allocate
+SHARED_ZEROS_F32 = np.zeros(2 * SAMPLE_RATE, dtype=np.float32)
+SHARED_ZEROS_F32.flags.writeable = False
 
 
-@pytest_asyncio.fixture
-async def test_db() -> AsyncGenerator[AsyncSession, None]:
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
     """
-    Create test database session using in-memory SQLite.
-    
-    This fixture:
-    1. Creates an in-memory database
-    2. Imports models to register them
-    3. Creates all tables
-    4. Yields a session for testing
-    5. Cleans up after test
+    Preload the audio stack once per session (per worker under xdist).
+
+    Opt in with CI_WARM=1. Also caps torch threads so parallel workers
+    don't oversubscribe the CPU.
     """
-    # Import Base here to avoid loading main app at module level
-    from src.database import Base
-    
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    if os.environ.get("CI_WARM") == "1":
+        import importlib
+
+        importlib.import_module("src.audio.stt")
+        importlib.import_module("src.audio.tts")
+
+        try:
+            import torch
+        except ImportError:
+            pass
+        else:
+            workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+    yield
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
 
-    async_session = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Create one in-memory SQLite engine with the schema for the whole run.
+
+    StaticPool keeps a single connection so every session sees the same
+    in-memory database.
+    """
+    # Import here so test collection doesn't load SQLAlchemy or the app
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from src.database import Base
+
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
-    async with async_session() as session:
-        yield session
+    # pysqlite manages transactions itself and breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN so nested transactions roll back correctly
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
 
     await engine.dispose()
 
 
-@pytest.fixture
-def client():
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_db(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
     """
-    Create test client for FastAPI app.
-    
-    Import is done here to avoid loading app at module level,
-    which would trigger database initialization.
+    Create test database session using in-memory SQLite.
+
+    This fixture:
+    1. Opens a transaction on the shared test engine
+    2. Yields a session whose commits become SAVEPOINTs
+    3. Rolls everything back after the test
+
+    Tests using it must run on the session loop:
+    ``@pytest.mark.asyncio(loop_scope="session")``.
     """
-    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """
+    Async HTTP client that calls the app in-process over ASGI.
+
+    Skips TestClient's per-request thread hop; the app lifespan runs once for
+    the session.
+    """
+    import httpx
+    from src.api.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            yield c
+
+
+@pytest.fixture(scope="session")
+def app_route_paths() -> frozenset:
+    """Every path registered on the app, collected once per session."""
     from src.api.main import app
-    return TestClient(app)
+
+    def walk(routes, prefix=""):
+        for route in routes:
+            if hasattr(route, "path"):
+                yield prefix + route.path
+            elif hasattr(route, "original_router"):
+                # Newer FastAPI keeps included routers wrapped instead of copying routes
+                yield from walk(
+                    route.original_router.routes, prefix + route.include_context.prefix
+                )
+
+    return frozenset(walk(app.routes))
+
+
+@pytest.fixture(scope="session")
+def settings_():
+    """Cached application settings, shared by the whole session."""
+    from src.config import get_settings
+
+    return get_settings()
+
+
+@pytest.fixture
+def fresh_settings(monkeypatch):
+    """
+    get_settings with its cache cleared, so monkeypatched env vars take effect.
+
+    The cache is cleared again afterwards; later callers get a new instance
+    built from the restored environment (settings_ keeps the original).
+    """
+    from src.config import get_settings
+
+    get_settings.cache_clear()
+    yield get_settings
+    get_settings.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def twilio_service():
+    """
+    Twilio service with test credentials, shared by the whole session.
+
+    Tests must not mutate it; build a local TwilioService() instead.
+    """
+    from src.services.twilio_service import TwilioService
+
+    return TwilioService(
+        account_sid="test_sid",
+        auth_token="test_token",
+        phone_number="+1234567890",
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_stt():
+    """
+    Local Whisper STT with its model loaded once for the whole session.
+
+    Skips when MLX Whisper isn't installed (non-Apple machines).
+    """
+    pytest.importorskip("mlx_whisper")
+    from src.audio.stt import WhisperSTT
+
+    stt = WhisperSTT(provider="local")
+    stt.load_model()
+    return stt
+
+
+@pytest.fixture(scope="session")
+def shared_tts():
+    """
+    Kokoro TTS with its pipeline loaded once for the whole session.
+
+    Skips when Kokoro isn't installed.
+    """
+    pytest.importorskip("kokoro")
+    from src.audio.tts import KokoroTTS
+
+    tts = KokoroTTS()
+    tts._load_model()
+    return tts
 
 
 @pytest.fixture
@@ -90,27 +281,31 @@ def sample_property_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_bytes() -> bytes:
     """Sample audio data for testing (440Hz sine wave)."""
-    duration = 1.0
-    sample_rate = 16000
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    audio = np.sin(2 * np.pi * 440 * t)
-    return (audio * 32767).astype(np.int16).tobytes()
+    return _SINE_BYTES
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_float() -> np.ndarray:
-    """Sample audio as float32 numpy array."""
-    duration = 1.0
-    sample_rate = 16000
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    return np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    """Sample audio as float32 numpy array (read-only)."""
+    return _SINE_F32
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_audio() -> np.ndarray:
+    """Longer sample audio for transcription (2 second 440Hz sine, read-only)."""
+    return _SINE_2S_F32
+
+
+@pytest.fixture(scope="session")
 def silent_audio() -> np.ndarray:
-    """Silent audio for testing (1 second)."""
-    sample_rate = 16000
-    return np.zeros(sample_rate, dtype=np.float32)
+    """Silent audio for testing (1 second, read-only)."""
+    return SHARED_ZEROS_F32[:SAMPLE_RATE]
+
+
+@pytest.fixture(scope="session")
+def silent_audio_2s() -> np.ndarray:
+    """Silent audio for testing (2 seconds, read-only)."""
+    return SHARED_ZEROS_F32
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Regenerate the precomputed test audio loaded by tests/conftest.py."""
+
+from pathlib import Path
+
+import numpy as np
+
+AUDIO_DIR = Path(__file__).parent
+SAMPLE_RATE = 16000
+
+
+def main():
+    """Write a 2 second 440Hz float32 sine at 16kHz."""
+    t = np.arange(SAMPLE_RATE, dtype=np.float32) / SAMPLE_RATE
+    sine = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    # 440Hz fits a whole number of cycles in 1s, so 2s is the same buffer twice
+    np.save(AUDIO_DIR / "sine_440_2s.npy", np.tile(sine, 2))
+
+
+if __name__ == "__main__":
+    main()
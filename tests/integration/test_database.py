@@ -9,7 +9,6 @@ Tests:
 - Call log model CRUD
 """
 import pytest
-import pytest_asyncio
 from datetime import datetime
 
 
@@ -77,10 +76,13 @@ class TestDatabaseSetup:
         from src.database import get_session
         
         try:
-            async for session in get_session():
+            gen = get_session()
+            session = await anext(gen)
+            try:
                 assert session is not None
                 print("   Session acquired ✓")
-                break
+            finally:
+                await gen.aclose()
             print("✅ Database session working")
         except Exception as e:
             print(f"❌ Session acquisition failed: {e}")
@@ -90,27 +92,8 @@ class TestDatabaseSetup:
 class TestPropertyModel:
     """Test Property model operations."""
 
-    @pytest_asyncio.fixture
-    async def db_session(self):
-        """Create test database session."""
-        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-        from src.database import Base
-        
-        # Use in-memory SQLite for tests
-        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-        
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        
-        session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-        
-        async with session_maker() as session:
-            yield session
-        
-        await engine.dispose()
-
-    @pytest.mark.asyncio
-    async def test_create_property(self, db_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_create_property(self, test_db):
         """
         TEST: Create a property record
         
@@ -134,17 +117,17 @@ class TestPropertyModel:
             zip_code="78701"
         )
         
-        db_session.add(property_data)
-        await db_session.commit()
-        await db_session.refresh(property_data)
+        test_db.add(property_data)
+        await test_db.commit()
+        await test_db.refresh(property_data)
         
         assert property_data.id is not None
         print(f"   Created property ID: {property_data.id}")
         print(f"   Title: {property_data.title}")
         print("✅ Property created successfully")
 
-    @pytest.mark.asyncio
-    async def test_query_property(self, db_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_query_property(self, test_db):
         """
         TEST: Query property from database
         
@@ -168,11 +151,11 @@ class TestPropertyModel:
             state="TX",
             zip_code="75201"
         )
-        db_session.add(prop)
-        await db_session.commit()
+        test_db.add(prop)
+        await test_db.commit()
         
         # Query it back
-        result = await db_session.execute(
+        result = await test_db.execute(
             select(Property).where(Property.title == "Query Test Property")
         )
         queried = result.scalar_one_or_none()
@@ -188,26 +171,8 @@ class TestPropertyModel:
 class TestCallLogModel:
     """Test CallLog model operations."""
 
-    @pytest_asyncio.fixture
-    async def db_session(self):
-        """Create test database session."""
-        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-        from src.database import Base
-        
-        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-        
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        
-        session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-        
-        async with session_maker() as session:
-            yield session
-        
-        await engine.dispose()
-
-    @pytest.mark.asyncio
-    async def test_create_call_log(self, db_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_create_call_log(self, test_db):
         """
         TEST: Create a call log record
         
@@ -228,17 +193,17 @@ class TestCallLogModel:
             summary="Customer inquiry about properties"
         )
         
-        db_session.add(call_log)
-        await db_session.commit()
-        await db_session.refresh(call_log)
+        test_db.add(call_log)
+        await test_db.commit()
+        await test_db.refresh(call_log)
         
         assert call_log.id is not None
         print(f"   Created call log ID: {call_log.id}")
         print(f"   Call SID: {call_log.call_sid}")
         print("✅ Call log created successfully")
 
-    @pytest.mark.asyncio
-    async def test_query_call_log(self, db_session):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_query_call_log(self, test_db):
         """
         TEST: Query call log from database
         
@@ -256,11 +221,11 @@ class TestCallLogModel:
             to_number="+2222222222",
             status=CallStatus.COMPLETED
         )
-        db_session.add(log)
-        await db_session.commit()
+        test_db.add(log)
+        await test_db.commit()
         
         # Query it back
-        result = await db_session.execute(
+        result = await test_db.execute(
             select(CallLog).where(CallLog.call_sid == "CA987654321")
         )
         queried = result.scalar_one_or_none()
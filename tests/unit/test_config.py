@@ -12,194 +12,103 @@ import pytest
 from unittest.mock import patch
 import os
 
+from src.config import get_settings
+
+# Settings that are only populated from the environment / .env
+API_KEY_SETTINGS = ("groq_api_key", "openai_api_key", "pinecone_api_key", "twilio_account_sid")
+
 
 class TestConfigLoading:
     """Test configuration loading and defaults."""
 
-    def test_settings_import(self):
-        """
-        TEST: Settings module imports successfully
-        
-        Expected: No import errors
-        """
-        print("\n🔧 Testing settings import...")
-        from src.config import settings, get_settings, Settings
-        
-        assert settings is not None
-        assert get_settings is not None
-        assert Settings is not None
-        print("✅ Settings module imported successfully")
-
     def test_settings_singleton(self):
         """
         TEST: Settings uses singleton pattern (cached)
         
         Expected: Same instance returned each time
         """
-        print("\n🔧 Testing settings singleton...")
-        from src.config import get_settings
-        
-        settings1 = get_settings()
-        settings2 = get_settings()
-        
-        assert settings1 is settings2, "Settings should be cached singleton"
-        print("✅ Settings singleton working correctly")
-
-    def test_default_values(self):
+        assert get_settings() is get_settings(), "Settings should be cached singleton"
+
+    def test_settings_env_override(self, fresh_settings, monkeypatch):
+        """
+        TEST: Environment variables override defaults once the cache is reset
+        
+        Expected: New settings instance picks up the patched value
+        """
+        monkeypatch.setenv("APP_PORT", "9001")
+        
+        assert fresh_settings().app_port == 9001
+
+    @pytest.mark.parametrize(
+        "attr,check",
+        [
+            # App
+            ("app_name", lambda v: v == "realtime-phone-agent"),
+            ("app_port", lambda v: v == 8000),
+            ("debug", lambda v: v is False),
+            # Models
+            ("whisper_model_size", lambda v: v in ["tiny", "base", "small"]),
+            ("tts_voice", lambda v: v is not None),
+            ("stt_provider", lambda v: v in ["local", "faster_whisper", "groq"]),
+            # Audio: 16kHz mono for Whisper
+            ("audio_sample_rate", lambda v: v == 16000),
+            ("audio_channels", lambda v: v == 1),
+            # Groq
+            ("groq_base_url", lambda v: v == "https://api.groq.com/openai/v1"),
+            ("groq_model", lambda v: v is not None),
+            # Database
+            ("database_url", lambda v: "sqlite" in v or "postgresql" in v),
+            # Pinecone
+            ("pinecone_index_name", lambda v: v is not None),
+            ("embedding_model", lambda v: v is not None),
+            ("embedding_dimension", lambda v: v > 0),
+        ],
+    )
+    def test_setting(self, settings_, attr, check):
         """
         TEST: Default configuration values are set
         
-        Expected: All defaults match expected values
-        """
-        print("\n🔧 Testing default values...")
-        from src.config import settings
-        
-        # App defaults
-        assert settings.app_name == "realtime-phone-agent"
-        assert settings.app_port == 8000
-        assert settings.debug == False
-        print(f"   App name: {settings.app_name}")
-        print(f"   App port: {settings.app_port}")
-        
-        # Model defaults
-        assert settings.whisper_model_size in ["tiny", "base", "small"]
-        assert settings.tts_voice is not None
-        print(f"   Whisper model: {settings.whisper_model_size}")
-        print(f"   TTS voice: {settings.tts_voice}")
-        
-        # STT provider
-        assert settings.stt_provider in ["local", "groq"]
-        print(f"   STT provider: {settings.stt_provider}")
-        
-        print("✅ All default values are correct")
-
-    def test_audio_settings(self):
+        Expected: Each setting passes its check
         """
-        TEST: Audio settings are configured correctly
+        value = getattr(settings_, attr)
         
-        Expected: Standard audio configuration
-        """
-        print("\n🔧 Testing audio settings...")
-        from src.config import settings
-        
-        assert settings.audio_sample_rate == 16000, "Sample rate should be 16kHz for Whisper"
-        assert settings.audio_channels == 1, "Should be mono audio"
-        
-        print(f"   Sample rate: {settings.audio_sample_rate}Hz")
-        print(f"   Channels: {settings.audio_channels}")
-        print("✅ Audio settings correct")
+        assert check(value), f"{attr}={value!r}"
 
 
 class TestLLMConfiguration:
     """Test LLM provider configuration."""
 
-    def test_llm_availability_properties(self):
+    def test_llm_availability_properties(self, settings_):
         """
         TEST: LLM availability properties work correctly
         
         Expected: Properties return bool based on key presence
         """
-        print("\n🔧 Testing LLM availability checks...")
-        from src.config import settings
-        
         # These are properties that check if keys are set
-        primary_available = settings.primary_llm_available
-        groq_available = settings.groq_llm_available
-        fallback_available = settings.fallback_llm_available
-        
-        print(f"   Z.ai (primary) available: {primary_available}")
-        print(f"   Groq available: {groq_available}")
-        print(f"   OpenAI (fallback) available: {fallback_available}")
+        primary_available = settings_.primary_llm_available
+        groq_available = settings_.groq_llm_available
+        fallback_available = settings_.fallback_llm_available
         
         # At least one should be available if .env is configured
         assert isinstance(primary_available, bool)
         assert isinstance(groq_available, bool)
         assert isinstance(fallback_available, bool)
-        
-        print("✅ LLM availability checks working")
-
-    def test_groq_settings(self):
-        """
-        TEST: Groq settings are configured
-        
-        Expected: Base URL and model are set
-        """
-        print("\n🔧 Testing Groq settings...")
-        from src.config import settings
-        
-        assert settings.groq_base_url == "https://api.groq.com/openai/v1"
-        assert settings.groq_model is not None
-        
-        print(f"   Groq base URL: {settings.groq_base_url}")
-        print(f"   Groq model: {settings.groq_model}")
-        print("✅ Groq settings correct")
-
-
-class TestDatabaseConfiguration:
-    """Test database configuration."""
-
-    def test_database_url(self):
-        """
-        TEST: Database URL is configured
-        
-        Expected: SQLite URL pattern for development
-        """
-        print("\n🔧 Testing database configuration...")
-        from src.config import settings
-        
-        assert settings.database_url is not None
-        assert "sqlite" in settings.database_url or "postgresql" in settings.database_url
-        
-        print(f"   Database URL: {settings.database_url}")
-        print("✅ Database configuration correct")
-
-    def test_pinecone_settings(self):
-        """
-        TEST: Pinecone settings are configured
-        
-        Expected: Index name and embedding settings present
-        """
-        print("\n🔧 Testing Pinecone settings...")
-        from src.config import settings
-        
-        assert settings.pinecone_index_name is not None
-        assert settings.embedding_model is not None
-        assert settings.embedding_dimension > 0
-        
-        print(f"   Index name: {settings.pinecone_index_name}")
-        print(f"   Embedding model: {settings.embedding_model}")
-        print(f"   Embedding dimension: {settings.embedding_dimension}")
-        print("✅ Pinecone settings correct")
 
 
 class TestEnvironmentVariables:
     """Test environment variable handling."""
 
-    def test_env_file_loaded(self):
+    def test_env_file_loaded(self, settings_):
         """
         TEST: .env file is being loaded
         
         Expected: At least some values from .env are present
         """
-        print("\n🔧 Testing .env file loading...")
-        from src.config import settings
-        
-        # Check if any API keys are set (indicates .env loaded)
-        has_any_key = (
-            bool(settings.groq_api_key) or
-            bool(settings.openai_api_key) or
-            bool(settings.pinecone_api_key) or
-            bool(settings.twilio_account_sid)
-        )
-        
-        if has_any_key:
-            print("   Found API keys in configuration")
-            print("✅ .env file loaded successfully")
-        else:
-            print("   ⚠️  No API keys found - make sure .env is configured")
+        # Any API key set indicates .env loaded
+        if not any(getattr(settings_, key) for key in API_KEY_SETTINGS):
             pytest.skip("No API keys configured - skipping env test")
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
+    pytest.main([__file__, "-v"])
 
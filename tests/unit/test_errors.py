@@ -0,0 +1,46 @@
+"""
+Unit tests for the error hierarchy.
+
+Run with: pytest tests/unit/test_errors.py -v
+
+Tests:
+- Errors keep code, message and details through pickle and copy
+"""
+import copy
+import pickle
+
+import pytest
+
+from src.utils.errors import AgentError, TranscriptionError, TTSError
+
+
+class TestErrorRoundTrip:
+    """Test that slotted errors survive pickling and copying."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            TranscriptionError("boom", {"a": 1}),
+            TTSError(),
+            AgentError("E999", "custom", {"b": 2}),
+        ],
+        ids=["coded-with-details", "coded-default", "base"],
+    )
+    @pytest.mark.parametrize(
+        "roundtrip",
+        [lambda e: pickle.loads(pickle.dumps(e)), copy.copy],
+        ids=["pickle", "copy"],
+    )
+    def test_roundtrip(self, error, roundtrip):
+        """
+        TEST: Error attributes survive a pickle or copy round trip
+        
+        Expected: Same type, code, message, details and str()
+        """
+        restored = roundtrip(error)
+
+        assert type(restored) is type(error)
+        assert restored.code == error.code
+        assert restored.message == error.message
+        assert dict(restored.details) == dict(error.details)
+        assert str(restored) == str(error)
@@ -0,0 +1,41 @@
+"""
+Unit tests for module imports.
+
+Run with: pytest tests/unit/test_imports.py -v
+
+Tests:
+- App, routes, services and settings import from their public modules
+"""
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "src.api.main:app",
+        "src.api.routes.health:router",
+        "src.api.routes.voice:router",
+        "src.api.routes.webhooks:router",
+        "src.services:TwilioService",
+        "src.services:CallService",
+        "src.services:SearchService",
+        "src.config:settings",
+        "src.config:get_settings",
+        "src.config:Settings",
+    ],
+)
+def test_importable(path):
+    """
+    TEST: Public object imports successfully
+
+    Expected: Module imports and exposes the attribute
+    """
+    module_name, attr = path.split(":")
+
+    assert getattr(importlib.import_module(module_name), attr) is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
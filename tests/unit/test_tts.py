@@ -65,35 +65,34 @@ class TestKokoroTTSInit:
         print(f"   Custom voice set: {tts.voice}")
         print("✅ Custom voice accepted")
 
+    def test_resolve_device(self):
+        """
+        TEST: Device autodetect falls back in cuda -> mps -> cpu order
+        
+        Expected: Explicit devices pass through, "auto" resolves to one of them
+        """
+        from src.audio.tts import resolve_device
+
+        assert resolve_device("cpu") == "cpu"
+        assert resolve_device("auto") in ("cuda", "mps", "cpu")
+
 
 class TestKokoroTTSSynthesis:
     """Test TTS synthesis functionality."""
 
-    @pytest.fixture
-    def tts_instance(self):
-        """Create TTS instance for tests."""
-        from src.audio.tts import KokoroTTS
-        return KokoroTTS()
-
-    def test_model_loading(self, tts_instance):
+    def test_model_loading(self, shared_tts):
         """
         TEST: Kokoro model loads successfully (downloads if needed)
         
         Expected: Model loaded without errors
         NOTE: First run will download ~150MB model
         """
-        print("\n🗣️ Testing model loading (may download on first run)...")
-        print("   This might take a minute if model needs to download...")
+        print("\n🗣️ Testing model loading...")
         
-        try:
-            tts_instance._load_model()
-            assert tts_instance._pipeline is not None
-            print("✅ Kokoro model loaded successfully")
-        except Exception as e:
-            print(f"❌ Model loading failed: {e}")
-            raise
+        assert shared_tts._pipeline is not None
+        print("✅ Kokoro model loaded successfully")
 
-    def test_synthesize_simple_text(self, tts_instance):
+    def test_synthesize_simple_text(self, shared_tts):
         """
         TEST: Synthesize simple text to audio
         
@@ -104,23 +103,92 @@ class TestKokoroTTSSynthesis:
         test_text = "Hello, this is a test."
         
         try:
-            audio = tts_instance.synthesize(test_text)
+            audio = shared_tts.synthesize(test_text)
             
             assert isinstance(audio, np.ndarray), "Output should be numpy array"
             assert audio.dtype == np.float32, "Audio should be float32"
             assert len(audio) > 0, "Audio should not be empty"
             
-            duration = len(audio) / tts_instance.sample_rate
+            duration = len(audio) / shared_tts.sample_rate
             print(f"   Generated {duration:.2f} seconds of audio")
             print(f"   Audio shape: {audio.shape}")
-            print(f"   Sample rate: {tts_instance.sample_rate}Hz")
+            print(f"   Sample rate: {shared_tts.sample_rate}Hz")
             print("✅ Text synthesis successful")
             
         except Exception as e:
             print(f"❌ Synthesis failed: {e}")
             raise
 
-    def test_synthesize_empty_text(self, tts_instance):
+    @pytest.mark.slow
+    def test_compiled_synthesis_matches(self, shared_tts):
+        """
+        TEST: torch.compile'd Kokoro model matches eager output
+        
+        Expected: Same audio (within float tolerance) from compiled and eager models
+        NOTE: First compiled call takes tens of seconds
+        """
+        print("\n🗣️ Testing compiled synthesis...")
+        from src.audio.tts import KokoroTTS
+        
+        compiled = KokoroTTS()
+        compiled.compile = True
+        compiled._load_model()
+        
+        text = "Hello, this is a test."
+        eager_audio = shared_tts.synthesize(text)
+        compiled_audio = compiled.synthesize(text)
+        
+        assert compiled_audio.shape == eager_audio.shape
+        np.testing.assert_allclose(compiled_audio, eager_audio, atol=1e-3)
+        print("✅ Compiled output matches eager")
+
+    @pytest.mark.slow
+    def test_int8_matches_fp32(self, shared_tts):
+        """
+        TEST: Dynamically quantized int8 Kokoro sounds like the float32 model
+        
+        Expected: Similar duration and loudness from int8 and float32 weights
+        """
+        print("\n🗣️ Testing int8 synthesis...")
+        from src.audio.tts import KokoroTTS
+        
+        outputs = {}
+        for dtype in ("float32", "int8"):
+            tts = KokoroTTS()
+            tts.dtype = dtype
+            tts._cache_size = 0
+            outputs[dtype] = tts.synthesize("Hello, this is a test.")
+        
+        fp32, int8 = outputs["float32"], outputs["int8"]
+        assert abs(len(int8) - len(fp32)) / len(fp32) < 0.1
+        rms_int8, rms_fp32 = (float(np.sqrt(np.mean(np.square(a)))) for a in (int8, fp32))
+        assert rms_int8 == pytest.approx(rms_fp32, rel=0.2)
+        print("✅ int8 output close to float32")
+
+    def test_cached_synthesis_is_fast(self, shared_tts):
+        """
+        TEST: Repeated synthesis of the same text is served from the cache
+        
+        Expected: Second call returns the same audio in <10% of the first call's time
+        """
+        print("\n🗣️ Testing synthesis cache...")
+        import time
+        
+        text = "Thanks for calling, how can I help?"
+        start = time.perf_counter()
+        first = shared_tts.synthesize(text)
+        first_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        second = shared_tts.synthesize(text)
+        second_time = time.perf_counter() - start
+        
+        np.testing.assert_array_equal(first, second)
+        assert second_time < 0.1 * first_time
+        print(f"   First: {first_time * 1000:.1f}ms, cached: {second_time * 1000:.3f}ms")
+        print("✅ Cached synthesis served")
+
+    def test_synthesize_empty_text(self, shared_tts):
         """
         TEST: Handle empty text input gracefully
         
@@ -128,14 +196,14 @@ class TestKokoroTTSSynthesis:
         """
         print("\n🗣️ Testing empty text handling...")
         
-        audio = tts_instance.synthesize("")
+        audio = shared_tts.synthesize("")
         
         assert isinstance(audio, np.ndarray)
         assert len(audio) == 0
         
         print("✅ Empty text handled correctly")
 
-    def test_sample_rate_property(self, tts_instance):
+    def test_sample_rate_property(self, shared_tts):
         """
         TEST: Sample rate property returns correct value
         
@@ -143,26 +211,36 @@ class TestKokoroTTSSynthesis:
         """
         print("\n🗣️ Testing sample rate property...")
         
-        assert tts_instance.sample_rate == 24000, "Kokoro outputs 24kHz audio"
+        assert shared_tts.sample_rate == 24000, "Kokoro outputs 24kHz audio"
         
-        print(f"   Sample rate: {tts_instance.sample_rate}Hz")
+        print(f"   Sample rate: {shared_tts.sample_rate}Hz")
         print("✅ Sample rate correct")
 
 
+    def test_gpu_synthesis(self, shared_tts):
+        """
+        TEST: Synthesis runs on an accelerator when one is available
+        
+        Expected: Model weights live on the resolved cuda/mps device
+        """
+        if shared_tts.device == "cpu":
+            pytest.skip("No CUDA or MPS device available")
+
+        params = next(shared_tts._pipeline.model.parameters())
+        assert params.device.type == shared_tts.device
+
+        audio = shared_tts.synthesize("Running on the GPU.")
+        assert len(audio) > 0
+
+
 class TestKokoroTTSStreaming:
     """Test TTS streaming functionality."""
 
-    @pytest.fixture
-    def tts_instance(self):
-        """Create TTS instance for tests."""
-        from src.audio.tts import KokoroTTS
-        return KokoroTTS()
-
-    def test_streaming_synthesis(self, tts_instance):
+    def test_streaming_synthesis(self, shared_tts):
         """
         TEST: Streaming synthesis yields audio chunks
         
-        Expected: Generator yields audio data (numpy arrays or tensors)
+        Expected: Generator yields float32 numpy arrays
         """
         print("\n🗣️ Testing streaming synthesis...")
         
@@ -170,19 +248,15 @@ class TestKokoroTTSStreaming:
         chunks = []
         
         try:
-            for chunk in tts_instance.synthesize_stream(test_text):
-                # Kokoro may return numpy arrays or tensors
-                # Convert to numpy if needed
-                if hasattr(chunk, 'numpy'):
-                    chunk = chunk.numpy()
-                elif not isinstance(chunk, np.ndarray):
-                    chunk = np.array(chunk)
+            for chunk in shared_tts.synthesize_stream(test_text):
+                assert isinstance(chunk, np.ndarray)
+                assert chunk.dtype == np.float32
                 chunks.append(chunk)
             
             assert len(chunks) > 0, "Should yield at least one chunk"
             
             total_samples = sum(len(c) for c in chunks)
-            duration = total_samples / tts_instance.sample_rate
+            duration = total_samples / shared_tts.sample_rate
             
             print(f"   Received {len(chunks)} audio chunks")
             print(f"   Total duration: {duration:.2f} seconds")
@@ -196,13 +270,7 @@ class TestKokoroTTSStreaming:
 class TestKokoroTTSFileOutput:
     """Test TTS file output functionality."""
 
-    @pytest.fixture
-    def tts_instance(self):
-        """Create TTS instance for tests."""
-        from src.audio.tts import KokoroTTS
-        return KokoroTTS()
-
-    def test_save_audio_to_file(self, tts_instance, tmp_path):
+    def test_save_audio_to_file(self, shared_tts, tmp_path):
         """
         TEST: Save synthesized audio to file
         
@@ -214,8 +282,8 @@ class TestKokoroTTSFileOutput:
         output_path = tmp_path / "test_output.wav"
         
         try:
-            audio = tts_instance.synthesize(test_text)
-            tts_instance.save_audio(audio, output_path)
+            audio = shared_tts.synthesize(test_text)
+            shared_tts.save_audio(audio, output_path)
             
             assert output_path.exists(), "Output file should exist"
             assert output_path.stat().st_size > 0, "File should not be empty"
@@ -228,17 +296,29 @@ class TestKokoroTTSFileOutput:
             print(f"❌ File save failed: {e}")
             raise
 
+    def test_save_audio_roundtrip(self, sample_audio_float, tmp_path):
+        """
+        TEST: Saved WAV reads back as the same 16-bit audio
+        
+        Expected: Standard header, matching sample rate and samples
+        """
+        import soundfile as sf
+        from src.audio.tts import KokoroTTS
+
+        tts = KokoroTTS()
+        output_path = tmp_path / "roundtrip.wav"
+        tts.save_audio(sample_audio_float, output_path)
+
+        audio, sample_rate = sf.read(output_path, dtype="float32")
+        assert sample_rate == tts.sample_rate
+        assert output_path.stat().st_size == 44 + 2 * len(sample_audio_float)
+        np.testing.assert_allclose(audio, sample_audio_float, atol=1 / 16384)
+
 
 class TestKokoroTTSCache:
     """Test TTS cache management."""
 
-    @pytest.fixture
-    def tts_instance(self):
-        """Create TTS instance for tests."""
-        from src.audio.tts import KokoroTTS
-        return KokoroTTS()
-
-    def test_clear_cache(self, tts_instance):
+    def test_clear_cache(self, shared_tts):
         """
         TEST: Cache clearing works without error
         
@@ -247,11 +327,8 @@ class TestKokoroTTSCache:
         print("\n🗣️ Testing cache clearing...")
         
         try:
-            # Load model first
-            tts_instance._load_model()
-            
-            # Clear cache
-            tts_instance.clear_cache()
+            # Model is already loaded by the shared fixture
+            shared_tts.clear_cache()
             
             print("✅ Cache cleared successfully")
             